@@ -0,0 +1,22 @@
+"""Build the optional compiled PAD kernel.
+
+Run ``python setup.py build_ext --inplace`` to place ``_pad_core`` next to
+``pad_strategy.py``. Without it the back-test falls back to numba or NumPy.
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensions = [
+    Extension(
+        "src._pad_core",
+        ["src/_pad_core.pyx"],
+        extra_compile_args=["-O3", "-ffast-math"],
+    )
+]
+
+setup(
+    name="algotrader2",
+    packages=[],
+    ext_modules=cythonize(extensions),
+)
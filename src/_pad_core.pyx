@@ -0,0 +1,68 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled PAD kernel.
+
+Build in place with ``python setup.py build_ext --inplace``. ``pad_strategy``
+uses it automatically when the extension is importable.
+"""
+
+import numpy as np
+
+
+cpdef tuple pad_core(
+    const double[::1] close,
+    double base_pad,
+    double inc_threshold_pct,
+    double dec_threshold_pct,
+    double increase_pad,
+    double decrease_pad,
+):
+    """Return the PAD history columns for ``close``.
+
+    Same signature and outputs as ``pad_strategy._pad_loop``.
+    """
+
+    cdef Py_ssize_t n = close.shape[0]
+    cdef Py_ssize_t i
+    cdef double hi_dep = base_pad * increase_pad
+    cdef double lo_dep = base_pad * decrease_pad
+    cdef double up_factor = 1 - inc_threshold_pct
+    cdef double dn_factor = 1 + dec_threshold_pct
+    cdef double prev = 0.0, curr, dep, tot_s = 0.0, tot_d = 0.0
+
+    deposit = np.empty(n, dtype=np.float64)
+    shares = np.empty(n, dtype=np.float64)
+    total_shares = np.empty(n, dtype=np.float64)
+    total_deposit = np.empty(n, dtype=np.float64)
+    portfolio = np.empty(n, dtype=np.float64)
+    net_profit = np.empty(n, dtype=np.float64)
+
+    cdef double[::1] deposit_v = deposit
+    cdef double[::1] shares_v = shares
+    cdef double[::1] total_shares_v = total_shares
+    cdef double[::1] total_deposit_v = total_deposit
+    cdef double[::1] portfolio_v = portfolio
+    cdef double[::1] net_profit_v = net_profit
+
+    for i in range(n):
+        curr = close[i]
+        # Deposit for first month is always the base amount
+        if i == 0:
+            dep = base_pad
+        elif curr <= prev * up_factor:
+            dep = hi_dep
+        elif curr >= prev * dn_factor:
+            dep = lo_dep
+        else:
+            dep = base_pad
+
+        tot_s += dep / curr
+        tot_d += dep
+        deposit_v[i] = dep
+        shares_v[i] = dep / curr
+        total_shares_v[i] = tot_s
+        total_deposit_v[i] = tot_d
+        portfolio_v[i] = tot_s * curr
+        net_profit_v[i] = tot_s * curr - tot_d
+        prev = curr
+
+    return deposit, shares, total_shares, total_deposit, portfolio, net_profit
@@ -1,17 +1,181 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import yfinance as yf
+from pyarrow import csv as pacsv
 import os
+from collections.abc import Sequence
+from datetime import date
+from functools import lru_cache
+from itertools import product
+from pathlib import Path
+
+# Compiled kernel from ``python setup.py build_ext --inplace``. The module
+# is importable as ``src._pad_core`` from the repo root and as ``_pad_core``
+# when this file is run as a script.
+try:
+    from src._pad_core import pad_core as _pad_core
+except ImportError:
+    try:
+        from _pad_core import pad_core as _pad_core
+    except ImportError:
+        _pad_core = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; only backtest_pad_polars needs it
+    pl = None
+
+
+def fetch_price_data(ticker: str, cache_dir: str | None = ".cache") -> pd.DataFrame:
+    """Fetch monthly close prices for a ticker using yfinance.
+
+    Downloads are stored as parquet in ``cache_dir`` keyed by ticker,
+    interval and the current date, so repeated runs on the same day reuse
+    them. Pass ``cache_dir=None`` to always download.
+    """
 
-
-def fetch_price_data(ticker: str) -> pd.DataFrame:
-    """Fetch monthly close prices for a ticker using yfinance."""
+    interval = "1mo"
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(
+            cache_dir, f"{ticker}_{interval}_{date.today()}.parquet"
+        )
+        if os.path.exists(cache_path):
+            return pd.read_parquet(cache_path, engine="pyarrow")
 
     ticker_obj = yf.Ticker(ticker)
-    hist = ticker_obj.history(period="max", interval="1mo")
+    hist = ticker_obj.history(period="max", interval=interval)
     hist = hist.reset_index()
-    return hist[["Date", "Close"]]
+    hist = hist[["Date", "Close"]]
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        hist.to_parquet(cache_path, engine="pyarrow", index=False)
+    return hist
+
+
+def _pad_loop(
+    close: np.ndarray,
+    base_pad: float,
+    inc_threshold_pct: float,
+    dec_threshold_pct: float,
+    increase_pad: float,
+    decrease_pad: float,
+) -> tuple[np.ndarray, ...]:
+    """Scalar PAD kernel, compiled by :func:`_numba_pad_loop` on request.
+
+    Returns the ``Deposit``, ``Shares``, ``TotalShares``, ``TotalDeposit``,
+    ``PortfolioValue`` and ``NetProfit`` columns for ``close``.
+    """
+
+    n = close.shape[0]
+    deposit = np.empty_like(close)
+    shares = np.empty_like(close)
+    total_shares = np.empty_like(close)
+    total_deposit = np.empty_like(close)
+    portfolio = np.empty_like(close)
+    net_profit = np.empty_like(close)
+
+    hi_dep = base_pad * increase_pad
+    lo_dep = base_pad * decrease_pad
+    up_factor = 1 - inc_threshold_pct
+    dn_factor = 1 + dec_threshold_pct
+
+    # There is no price before the first month; comparisons against NaN are
+    # false, so that month falls through to the base deposit.
+    prev_price = np.nan
+    tot_shares = 0.0
+    tot_deposit = 0.0
+    for i in range(n):
+        curr_price = float(close[i])
+
+        if curr_price <= prev_price * up_factor:
+            dep = hi_dep
+        elif curr_price >= prev_price * dn_factor:
+            dep = lo_dep
+        else:
+            dep = base_pad
+
+        tot_shares += dep / curr_price
+        tot_deposit += dep
+        deposit[i] = dep
+        shares[i] = dep / curr_price
+        total_shares[i] = tot_shares
+        total_deposit[i] = tot_deposit
+        portfolio[i] = tot_shares * curr_price
+        net_profit[i] = tot_shares * curr_price - tot_deposit
+        prev_price = curr_price
+
+    return deposit, shares, total_shares, total_deposit, portfolio, net_profit
+
+
+def _compute_regime(
+    close: np.ndarray, inc_threshold_pct: float, dec_threshold_pct: float
+) -> np.ndarray:
+    """Return the deposit regime for each month of ``close``.
+
+    ``1`` marks a drop past the increase threshold, ``-1`` a rise past the
+    decrease threshold and ``0`` anything else. The regime only depends on
+    prices and thresholds, so a sweep can compute it once and reuse it for
+    every combination of deposit amounts.
+    """
+
+    # Thresholds are always checked in float64, matching the scalar kernels
+    close = close.astype(np.float64, copy=False)
+
+    # NaN before the first month, as in _pad_loop
+    prev = np.empty(len(close), dtype=np.float64)
+    prev[:1] = np.nan
+    prev[1:] = close[:-1]
+
+    cond_up = close <= prev * (1 - inc_threshold_pct)
+    cond_dn = close >= prev * (1 + dec_threshold_pct)
+    return np.select([cond_up, cond_dn], [1, -1], default=0).astype(np.int8)
+
+
+@lru_cache(maxsize=None)
+def _numba_pad_loop():
+    """Return :func:`_pad_loop` compiled with numba, importing it on first use."""
+
+    try:
+        from numba import njit
+    except ImportError as exc:
+        raise ImportError("use_numba=True requires the numba package") from exc
+    return njit(_pad_loop)
+
+
+def _pad_vectorized(
+    close: np.ndarray,
+    base_pad: float,
+    inc_threshold_pct: float,
+    dec_threshold_pct: float,
+    increase_pad: float,
+    decrease_pad: float,
+) -> tuple[np.ndarray, ...]:
+    """NumPy PAD kernel returning the same columns as :func:`_pad_loop`."""
+
+    n = len(close)
+    shares = np.empty(n, dtype=close.dtype)
+    total_shares = np.empty(n, dtype=close.dtype)
+    total_deposit = np.empty(n, dtype=close.dtype)
+    portfolio = np.empty(n, dtype=close.dtype)
+    net_profit = np.empty(n, dtype=close.dtype)
+
+    regime = _compute_regime(close, inc_threshold_pct, dec_threshold_pct)
+    deposit = base_pad * np.select(
+        [regime == 1, regime == -1], [increase_pad, decrease_pad], default=1.0
+    )
+    deposit = deposit.astype(close.dtype, copy=False)
+
+    np.divide(deposit, close, out=shares)
+    np.cumsum(shares, out=total_shares)
+    np.cumsum(deposit, out=total_deposit)
+    np.multiply(total_shares, close, out=portfolio)
+    np.subtract(portfolio, total_deposit, out=net_profit)
+    return deposit, shares, total_shares, total_deposit, portfolio, net_profit
 
 
 def backtest_pad(
@@ -21,6 +185,8 @@ def backtest_pad(
     decrease_threshold: float = 20.0,
     increase_pad: float = 1.2,
     decrease_pad: float = 0.8,
+    dtype: np.dtype | type = np.float64,
+    use_numba: bool = False,
 ) -> pd.DataFrame:
     """Backtests a percentage allocation strategy on VOO.
 
@@ -38,6 +204,14 @@ def backtest_pad(
         Multiplier for the purchase amount when price drops sufficiently.
     decrease_pad : float, default 0.8
         Multiplier for the purchase amount when price rises sufficiently.
+    dtype : numpy dtype, default np.float64
+        Floating point type for prices and the computed columns.
+        ``np.float32`` halves the memory moved on long series; its precision
+        is ample for share counts and dollar totals at these magnitudes.
+        Prices are rounded to this type before the threshold checks.
+    use_numba : bool, default False
+        Run the numba-compiled loop. Compiling takes a fraction of a second,
+        so this only pays off for long series or many calls in one process.
 
     Returns
     -------
@@ -46,66 +220,197 @@ def backtest_pad(
         ``TotalShares``, ``PortfolioValue``, ``TotalDeposit`` and ``NetProfit``.
     """
 
-    df = price_df.copy().reset_index(drop=True)
-    if not {"Date", "Close"}.issubset(df.columns):
+    if not {"Date", "Close"}.issubset(price_df.columns):
         raise ValueError("price_df must contain 'Date' and 'Close' columns")
+    if price_df.empty:
+        raise ValueError("price_df must contain at least one row")
+
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype must be float32 or float64")
+
+    close_arr = np.ascontiguousarray(price_df["Close"].to_numpy(dtype=dtype))
+    # ``.array`` keeps timezone-aware dates (as returned by yfinance) typed
+    # instead of boxing them into an object ndarray.
+    if pd.api.types.is_datetime64_any_dtype(price_df["Date"]):
+        date_arr = price_df["Date"].array
+    else:
+        date_arr = pd.to_datetime(price_df["Date"]).array
 
-    df["Date"] = pd.to_datetime(df["Date"])
-
-    history = []
-    total_shares = 0.0
-    total_deposit = 0.0
     inc_threshold_pct = increase_threshold / 100.0
     dec_threshold_pct = decrease_threshold / 100.0
 
-    # Deposit for first month
-    first_price = df.loc[0, "Close"]
-    deposit = base_pad
-    total_deposit += deposit
-    total_shares += deposit / first_price
-    history.append(
+    if use_numba:
+        kernel = _numba_pad_loop()
+    # The compiled extension is typed for float64 only
+    elif _pad_core is not None and close_arr.dtype == np.float64:
+        kernel = _pad_core
+    else:
+        kernel = _pad_vectorized
+    (
+        deposit_arr,
+        shares_arr,
+        total_shares_arr,
+        total_deposit_arr,
+        portfolio_arr,
+        net_profit_arr,
+    ) = kernel(
+        close_arr,
+        base_pad,
+        inc_threshold_pct,
+        dec_threshold_pct,
+        increase_pad,
+        decrease_pad,
+    )
+
+    result = pd.DataFrame(
         {
-            "Date": df.loc[0, "Date"],
-            "Price": first_price,
-            "Deposit": deposit,
-            "Shares": deposit / first_price,
-            "TotalShares": total_shares,
-            "PortfolioValue": total_shares * first_price,
-            "TotalDeposit": total_deposit,
-            "NetProfit": total_shares * first_price - total_deposit,
+            "Date": date_arr,
+            "Price": close_arr,
+            "Deposit": deposit_arr,
+            "Shares": shares_arr,
+            "TotalShares": total_shares_arr,
+            "PortfolioValue": portfolio_arr,
+            "TotalDeposit": total_deposit_arr,
+            "NetProfit": net_profit_arr,
         }
     )
+    return result
 
-    # Iterate over remaining months
-    for idx in range(1, len(df)):
-        prev_price = df.loc[idx - 1, "Close"]
-        curr_price = df.loc[idx, "Close"]
 
-        if curr_price <= prev_price * (1 - inc_threshold_pct):
-            deposit = base_pad * increase_pad
-        elif curr_price >= prev_price * (1 + dec_threshold_pct):
-            deposit = base_pad * decrease_pad
-        else:
-            deposit = base_pad
-
-        shares = deposit / curr_price
-        total_deposit += deposit
-        total_shares += shares
-        history.append(
-            {
-                "Date": df.loc[idx, "Date"],
-                "Price": curr_price,
-                "Deposit": deposit,
-                "Shares": shares,
-                "TotalShares": total_shares,
-                "PortfolioValue": total_shares * curr_price,
-                "TotalDeposit": total_deposit,
-                "NetProfit": total_shares * curr_price - total_deposit,
-            }
+def backtest_pad_grid(
+    price_df: pd.DataFrame,
+    base_pads: Sequence[float] = (100.0,),
+    increase_thresholds: Sequence[float] = (20.0,),
+    decrease_thresholds: Sequence[float] = (20.0,),
+    increase_pads: Sequence[float] = (1.2,),
+    decrease_pads: Sequence[float] = (0.8,),
+) -> pd.DataFrame:
+    """Backtest every combination of PAD parameters in a single pass.
+
+    Each argument is a sequence of values for the matching
+    :func:`backtest_pad` parameter. For each pair of thresholds, every
+    combination of deposit amounts is evaluated together as
+    ``(combinations, months)`` arrays instead of one backtest per call.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per combination with columns ``BasePad``,
+        ``IncreaseThreshold``, ``DecreaseThreshold``, ``IncreasePad``,
+        ``DecreasePad``, ``PortfolioValue``, ``TotalDeposit`` and
+        ``NetProfit``.
+    """
+
+    if "Close" not in price_df.columns:
+        raise ValueError("price_df must contain a 'Close' column")
+    if price_df.empty:
+        raise ValueError("price_df must contain at least one row")
+
+    close = price_df["Close"].to_numpy(dtype=np.float64)
+    grids = np.meshgrid(
+        np.asarray(base_pads, dtype=np.float64),
+        np.asarray(increase_pads, dtype=np.float64),
+        np.asarray(decrease_pads, dtype=np.float64),
+        indexing="ij",
+    )
+    base, inc_pad, dec_pad = (g.reshape(-1, 1) for g in grids)
+
+    # The regime only depends on the thresholds, so it is computed once per
+    # threshold pair and broadcast across every combination of amounts.
+    results = []
+    for inc_thr, dec_thr in product(increase_thresholds, decrease_thresholds):
+        regime = _compute_regime(close, inc_thr / 100.0, dec_thr / 100.0)
+        deposit = base * np.select(
+            [regime == 1, regime == -1], [inc_pad, dec_pad], default=1.0
         )
 
-    result = pd.DataFrame(history)
-    return result
+        total_deposit = deposit.sum(axis=1)
+        total_shares = (deposit / close).sum(axis=1)
+        portfolio = total_shares * close[-1]
+        results.append(
+            pd.DataFrame(
+                {
+                    "BasePad": base[:, 0],
+                    "IncreaseThreshold": float(inc_thr),
+                    "DecreaseThreshold": float(dec_thr),
+                    "IncreasePad": inc_pad[:, 0],
+                    "DecreasePad": dec_pad[:, 0],
+                    "PortfolioValue": portfolio,
+                    "TotalDeposit": total_deposit,
+                    "NetProfit": portfolio - total_deposit,
+                }
+            )
+        )
+    return pd.concat(results, ignore_index=True)
+
+
+def backtest_pad_polars(
+    price_df: pl.DataFrame,
+    base_pad: float = 100.0,
+    increase_threshold: float = 20.0,
+    decrease_threshold: float = 20.0,
+    increase_pad: float = 1.2,
+    decrease_pad: float = 0.8,
+) -> pl.DataFrame:
+    """Polars version of :func:`backtest_pad`.
+
+    Takes a ``polars.DataFrame`` with ``Date`` and ``Close`` columns and
+    returns the same history columns as :func:`backtest_pad`, computed as a
+    single lazy query.
+    """
+
+    if pl is None:
+        raise ImportError("backtest_pad_polars requires the polars package")
+    if not {"Date", "Close"}.issubset(price_df.columns):
+        raise ValueError("price_df must contain 'Date' and 'Close' columns")
+    if price_df.is_empty():
+        raise ValueError("price_df must contain at least one row")
+
+    hi_dep = base_pad * increase_pad
+    lo_dep = base_pad * decrease_pad
+    up_factor = 1 - increase_threshold / 100.0
+    dn_factor = 1 + decrease_threshold / 100.0
+
+    date_expr = pl.col("Date")
+    if price_df.schema["Date"] == pl.String:
+        date_expr = date_expr.str.to_datetime()
+
+    prev_price = pl.col("Price").shift(1)
+    return (
+        price_df.lazy()
+        .select(date_expr, pl.col("Close").cast(pl.Float64).alias("Price"))
+        .with_columns(
+            pl.when(pl.col("Price") <= prev_price * up_factor)
+            .then(hi_dep)
+            .when(pl.col("Price") >= prev_price * dn_factor)
+            .then(lo_dep)
+            .otherwise(base_pad)
+            .alias("Deposit")
+        )
+        .with_columns((pl.col("Deposit") / pl.col("Price")).alias("Shares"))
+        .with_columns(
+            pl.col("Shares").cum_sum().alias("TotalShares"),
+            pl.col("Deposit").cum_sum().alias("TotalDeposit"),
+        )
+        .with_columns(
+            (pl.col("TotalShares") * pl.col("Price")).alias("PortfolioValue")
+        )
+        .with_columns(
+            (pl.col("PortfolioValue") - pl.col("TotalDeposit")).alias("NetProfit")
+        )
+        .select(
+            "Date",
+            "Price",
+            "Deposit",
+            "Shares",
+            "TotalShares",
+            "PortfolioValue",
+            "TotalDeposit",
+            "NetProfit",
+        )
+        .collect()
+    )
 
 
 def run_backtest(
@@ -120,7 +425,15 @@ def run_backtest(
     """Run the backtest using CSV data or by downloading data for ``ticker``."""
 
     if price_csv:
-        price_df = pd.read_csv(price_csv)
+        # Arrow converts offset timestamps to UTC, which can move dates east
+        # of UTC back a day, so Date is left as text for backtest_pad to parse.
+        table = pacsv.read_csv(
+            price_csv,
+            convert_options=pacsv.ConvertOptions(
+                column_types={"Close": pa.float64(), "Date": pa.string()}
+            ),
+        )
+        price_df = table.to_pandas(split_blocks=True, self_destruct=True)
     else:
         price_df = fetch_price_data(ticker)
     return backtest_pad(
@@ -136,9 +449,9 @@ def run_backtest(
 def calculate_lump_sum(result_df: pd.DataFrame) -> tuple[float, float]:
     """Return lump sum shares and profit using the backtest result."""
 
-    total_deposit = result_df.iloc[-1]["TotalDeposit"]
-    first_price = result_df.iloc[0]["Price"]
-    last_price = result_df.iloc[-1]["Price"]
+    total_deposit = result_df["TotalDeposit"].iat[-1]
+    first_price = result_df["Price"].iat[0]
+    last_price = result_df["Price"].iat[-1]
     shares = total_deposit / first_price
     profit = shares * last_price - total_deposit
     return shares, profit
@@ -206,94 +519,63 @@ if __name__ == "__main__":
     pd.set_option("display.max_rows", None)
     print(df)
 
-    final_value = df.iloc[-1]["PortfolioValue"]
-    total_deposit = df.iloc[-1]["TotalDeposit"]
+    final_value = df["PortfolioValue"].iat[-1]
+    total_deposit = df["TotalDeposit"].iat[-1]
     final_return = (final_value / total_deposit - 1) * 100
     net_profit = final_value - total_deposit
 
     # Use Price column from the backtest result for lump sum calculations
-    lumpsum_shares = total_deposit / df.iloc[0]["Price"]
-    lumpsum_value = lumpsum_shares * df.iloc[-1]["Price"]
+    lumpsum_shares = total_deposit / df["Price"].iat[0]
+    lumpsum_value = lumpsum_shares * df["Price"].iat[-1]
     lumpsum_profit = lumpsum_value - total_deposit
     profit_diff = net_profit - lumpsum_profit
     profit_diff_pct = (profit_diff / lumpsum_profit * 100) if lumpsum_profit != 0 else 0.0
-    start_date = df.iloc[0]["Date"].date()
-    end_date = df.iloc[-1]["Date"].date()
-    duration_days = (df.iloc[-1]["Date"] - df.iloc[0]["Date"]).days
+    start_date = df["Date"].iat[0].date()
+    end_date = df["Date"].iat[-1].date()
+    duration_days = (df["Date"].iat[-1] - df["Date"].iat[0]).days
 
     pad_annual_return = calculate_annual_return(final_value, total_deposit, duration_days)
     lump_annual_return = calculate_annual_return(lumpsum_value, total_deposit, duration_days)
     annual_diff = pad_annual_return - lump_annual_return
 
-    print("\nFinal portfolio value:", f"${final_value:,.2f}")
-    print("Total deposited:", f"${total_deposit:,.2f}")
-    print("Net profit:", f"${net_profit:,.2f}")
-    print(f"Final total return: {final_return:.2f}%")
-    print("Lump sum net profit:", f"${lumpsum_profit:,.2f}")
-    print(
-        f"Difference vs lump sum: ${profit_diff:,.2f} ({profit_diff_pct:.2f}%)"
+    summary = (
+        f"Final portfolio value: ${final_value:,.2f}\n"
+        f"Total deposited: ${total_deposit:,.2f}\n"
+        f"Net profit: ${net_profit:,.2f}\n"
+        f"Final total return: {final_return:.2f}%\n"
+        f"Lump sum net profit: ${lumpsum_profit:,.2f}\n"
+        f"Difference vs lump sum: ${profit_diff:,.2f} ({profit_diff_pct:.2f}%)\n"
+        f"PAD annual return: {pad_annual_return*100:.2f}%\n"
+        f"Lump sum annual return: {lump_annual_return*100:.2f}%\n"
+        f"Annual return difference: {annual_diff*100:.2f}%\n"
+        f"Start date: {start_date}\n"
+        f"End date: {end_date}\n"
+        f"Duration: {duration_days} days\n"
     )
-    print(f"PAD annual return: {pad_annual_return*100:.2f}%")
-    print(f"Lump sum annual return: {lump_annual_return*100:.2f}%")
-    print(f"Annual return difference: {annual_diff*100:.2f}%")
-    print("Start date:", start_date)
-    print("End date:", end_date)
-    print(f"Duration: {duration_days} days")
+    print(f"\n{summary}", end="")
+
+    fname_parts = [
+        args.ticker,
+        f"base{args.base}",
+        f"it{args.inc_thresh}",
+        f"dt{args.dec_thresh}",
+        f"ip{args.inc_pad}",
+        f"dp{args.dec_pad}",
+    ]
+    run_name = "_".join(fname_parts)
 
     if args.log:
-        os.makedirs(args.log, exist_ok=True)
-        fname_parts = [
-            args.ticker,
-            f"base{args.base}",
-            f"it{args.inc_thresh}",
-            f"dt{args.dec_thresh}",
-            f"ip{args.inc_pad}",
-            f"dp{args.dec_pad}",
-        ]
-        log_path = os.path.join(args.log, "_".join(fname_parts) + ".txt")
-        with open(log_path, "w") as f:
-            f.write(df.to_string(index=False))
-            f.write("\n\n")
-            f.write(f"Final portfolio value: ${final_value:,.2f}\n")
-            f.write(f"Total deposited: ${total_deposit:,.2f}\n")
-            f.write(f"Net profit: ${net_profit:,.2f}\n")
-            f.write(f"Final total return: {final_return:.2f}%\n")
-            f.write(f"Lump sum net profit: ${lumpsum_profit:,.2f}\n")
-            f.write(
-                f"Difference vs lump sum: ${profit_diff:,.2f} ({profit_diff_pct:.2f}%)\n"
-            )
-            f.write(f"PAD annual return: {pad_annual_return*100:.2f}%\n")
-            f.write(f"Lump sum annual return: {lump_annual_return*100:.2f}%\n")
-            f.write(f"Annual return difference: {annual_diff*100:.2f}%\n")
-            f.write(f"Start date: {start_date}\n")
-            f.write(f"End date: {end_date}\n")
-            f.write(f"Duration: {duration_days} days\n")
-        print(f"Results written to {log_path}")
+        log_dir = Path(args.log)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = log_dir / f"{run_name}.txt"
+        history_path = log_dir / f"{run_name}.parquet"
+        df.to_parquet(history_path, index=False)
+        log_path.write_text(summary)
+        print(f"Results written to {log_path} and {history_path}")
 
     if not args.no_results:
-        os.makedirs("results", exist_ok=True)
-        fname_parts = [
-            args.ticker,
-            f"base{args.base}",
-            f"it{args.inc_thresh}",
-            f"dt{args.dec_thresh}",
-            f"ip{args.inc_pad}",
-            f"dp{args.dec_pad}",
-        ]
-        results_path = os.path.join("results", "_".join(fname_parts) + ".txt")
-        with open(results_path, "w") as f:
-            f.write(f"Final portfolio value: ${final_value:,.2f}\n")
-            f.write(f"Total deposited: ${total_deposit:,.2f}\n")
-            f.write(f"Net profit: ${net_profit:,.2f}\n")
-            f.write(f"Final total return: {final_return:.2f}%\n")
-            f.write(f"Lump sum net profit: ${lumpsum_profit:,.2f}\n")
-            f.write(
-                f"Difference vs lump sum: ${profit_diff:,.2f} ({profit_diff_pct:.2f}%)\n"
-            )
-            f.write(f"PAD annual return: {pad_annual_return*100:.2f}%\n")
-            f.write(f"Lump sum annual return: {lump_annual_return*100:.2f}%\n")
-            f.write(f"Annual return difference: {annual_diff*100:.2f}%\n")
-            f.write(f"Start date: {start_date}\n")
-            f.write(f"End date: {end_date}\n")
-            f.write(f"Duration: {duration_days} days\n")
+        results_dir = Path("results")
+        results_dir.mkdir(exist_ok=True)
+        results_path = results_dir / f"{run_name}.txt"
+        results_path.write_text(summary)
         print(f"Summary written to {results_path}")
@@ -1,6 +1,20 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+import pytest
+from src import pad_strategy
 from src.pad_strategy import (
+    _compute_regime,
+    _numba_pad_loop,
+    _pad_loop,
+    _pad_vectorized,
     backtest_pad,
+    backtest_pad_grid,
+    backtest_pad_polars,
+    fetch_price_data,
+    run_backtest,
     calculate_lump_sum,
     calculate_annual_return,
 )
@@ -121,3 +135,153 @@ def test_calculate_annual_return():
     expected_ann = expected_ratio ** (1 / years) - 1
 
     assert abs(ann - expected_ann) < 1e-8
+
+
+def test_float32_backtest():
+    df = sample_price_df()
+    expected = backtest_pad(df)
+    result = backtest_pad(df, dtype=np.float32)
+
+    assert result["PortfolioValue"].dtype == np.float32
+    assert result["Deposit"].tolist() == expected["Deposit"].tolist()
+    for col in ["Shares", "TotalShares", "PortfolioValue", "TotalDeposit", "NetProfit"]:
+        assert np.allclose(result[col], expected[col], rtol=1e-5)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float16, "object"])
+def test_backtest_rejects_unsupported_dtype(dtype):
+    with pytest.raises(ValueError):
+        backtest_pad(sample_price_df(), dtype=dtype)
+
+
+def test_loop_kernel_matches_vectorized():
+    close = sample_price_df()["Close"].to_numpy(dtype=np.float64)
+    args = (close, 100.0, 0.2, 0.2, 1.2, 0.8)
+
+    close32 = close.astype(np.float32)
+    expected = _pad_vectorized(*args)
+    expected32 = _pad_vectorized(close32, *args[1:])
+
+    kernels = [_pad_loop]
+    if importlib.util.find_spec("numba") is not None:
+        kernels.append(_numba_pad_loop())
+    for kernel in kernels:
+        for got, exp in zip(kernel(*args), expected):
+            assert np.allclose(got, exp)
+        for got, exp in zip(kernel(close32, *args[1:]), expected32):
+            assert got.dtype == exp.dtype == np.float32
+            assert np.allclose(got, exp)
+
+
+def test_numba_backtest_matches_default():
+    pytest.importorskip("numba")
+    df = sample_price_df()
+
+    expected = backtest_pad(df)
+    result = backtest_pad(df, use_numba=True)
+
+    assert result["Deposit"].tolist() == expected["Deposit"].tolist()
+    assert np.allclose(result["NetProfit"], expected["NetProfit"])
+
+
+def test_compute_regime():
+    close = sample_price_df()["Close"].to_numpy(dtype=np.float64)
+
+    regime = _compute_regime(close, 0.2, 0.2)
+
+    assert regime.tolist() == [0, -1, 1, 0, 0, 1, 0, 0, 0, 0, -1, 1]
+
+
+def test_compiled_core_matches_vectorized():
+    pad_core = pytest.importorskip("src._pad_core").pad_core
+    close = sample_price_df()["Close"].to_numpy(dtype=np.float64)
+    args = (close, 100.0, 0.2, 0.2, 1.2, 0.8)
+
+    for got, exp in zip(pad_core(*args), _pad_vectorized(*args)):
+        assert np.allclose(got, exp)
+
+
+def test_run_backtest_from_csv():
+    csv_path = Path(__file__).resolve().parent.parent / "data" / "voo_prices.csv"
+    result = run_backtest(str(csv_path))
+    expected = backtest_pad(pd.read_csv(csv_path))
+
+    assert pd.api.types.is_datetime64_any_dtype(result["Date"])
+    assert result["Date"].tolist() == expected["Date"].tolist()
+    assert result["Deposit"].tolist() == expected["Deposit"].tolist()
+    assert abs(result["NetProfit"].iloc[-1] - expected["NetProfit"].iloc[-1]) < 1e-8
+
+
+def test_run_backtest_from_csv_keeps_utc_offset(tmp_path):
+    df = sample_price_df()
+    df["Date"] = df["Date"] + " 00:00:00+09:00"
+    csv_path = tmp_path / "tokyo.csv"
+    df.to_csv(csv_path, index=False)
+
+    result = run_backtest(str(csv_path))
+
+    assert result["Date"].iat[0] == pd.Timestamp("2021-01-31 00:00:00+09:00")
+    assert str(result["Date"].iat[0].date()) == "2021-01-31"
+    assert str(result["Date"].iat[-1].date()) == "2021-12-31"
+
+
+def test_fetch_price_data_uses_cache(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeTicker:
+        def __init__(self, ticker):
+            calls.append(ticker)
+
+        def history(self, period, interval):
+            df = sample_price_df()
+            df["Date"] = pd.to_datetime(df["Date"])
+            df["Open"] = df["Close"]
+            return df.set_index("Date")
+
+    monkeypatch.setattr(pad_strategy.yf, "Ticker", FakeTicker)
+
+    first = fetch_price_data("VOO", cache_dir=str(tmp_path))
+    second = fetch_price_data("VOO", cache_dir=str(tmp_path))
+
+    assert calls == ["VOO"]
+    assert list(second.columns) == ["Date", "Close"]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_polars_backtest_matches_pandas():
+    pl = pytest.importorskip("polars")
+    df = sample_price_df()
+
+    expected = backtest_pad(df)
+    result = backtest_pad_polars(pl.from_pandas(df))
+
+    assert result.columns == expected.columns.tolist()
+    assert result["Deposit"].to_list() == expected["Deposit"].tolist()
+    for col in ["Shares", "TotalShares", "PortfolioValue", "TotalDeposit", "NetProfit"]:
+        assert np.allclose(result[col].to_numpy(), expected[col].to_numpy())
+
+
+def test_grid_matches_individual_backtests():
+    df = sample_price_df()
+    grid = backtest_pad_grid(
+        df,
+        base_pads=[100.0, 150.0],
+        increase_thresholds=[10.0, 20.0],
+        decrease_thresholds=[15.0, 20.0],
+        increase_pads=[1.2, 1.5],
+        decrease_pads=[0.8],
+    )
+
+    assert len(grid) == 16
+    for row in grid.itertuples():
+        result = backtest_pad(
+            df,
+            base_pad=row.BasePad,
+            increase_threshold=row.IncreaseThreshold,
+            decrease_threshold=row.DecreaseThreshold,
+            increase_pad=row.IncreasePad,
+            decrease_pad=row.DecreasePad,
+        )
+        assert abs(row.TotalDeposit - result["TotalDeposit"].iloc[-1]) < 1e-8
+        assert abs(row.PortfolioValue - result["PortfolioValue"].iloc[-1]) < 1e-8
+        assert abs(row.NetProfit - result["NetProfit"].iloc[-1]) < 1e-8